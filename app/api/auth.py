@@ -3,17 +3,19 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 
 from ..models.auth import Token, LoginRequest, User
-from ..services.auth_service import AuthService
+from ..services import AuthService, get_auth_service
 from ..config import settings
 from ..auth import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 security = HTTPBearer()
-auth_service = AuthService()
 
 
 @router.post("/login", response_model=Token)
-async def login(login_request: LoginRequest):
+async def login(
+    login_request: LoginRequest,
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """Authenticate user and return access token."""
     user = auth_service.authenticate_user(login_request.username, login_request.password)
     if not user:
@@ -1,6 +1,9 @@
 import asyncio
-from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, UploadFile, File
+import os
+import tempfile
+import time
+from fastapi import APIRouter, Depends, HTTPException, status, Request, UploadFile, File
+from fastapi.responses import ORJSONResponse
 from typing import List
 
 from ..models.auth import User
@@ -11,21 +14,36 @@ from ..models.evaluation import (
     BulkEvaluationResponse,
     AsyncEvaluationResponse,
     DatasetEvaluationRequest,
+    TestCaseResult,
+)
+from ..models.metrics import MetricResult
+from ..services import (
+    DeepEvalService,
+    JobService,
+    TaskQueue,
+    get_deepeval_service,
+    get_job_service,
+    get_task_queue,
 )
-from ..services.deepeval_service import DeepEvalService
-from ..services.job_service import JobService
 from ..config import settings
 from ..auth import get_current_user
 
-router = APIRouter(prefix="/evaluate", tags=["Evaluation"])
-deepeval_service = DeepEvalService()
-job_service = JobService()
+# Bulk results can serialize thousands of models - use orjson for responses
+router = APIRouter(prefix="/evaluate", tags=["Evaluation"], default_response_class=ORJSONResponse)
+
+# Test case fields a dataset file can populate, in model order
+_TEST_CASE_FIELDS = ['input', 'actual_output', 'expected_output', 'retrieval_context', 'context']
+
+# File suffixes accepted for dataset format auto-detection
+_CSV_SUFFIXES = frozenset({'.csv'})
+_JSON_SUFFIXES = frozenset({'.json', '.jsonl'})
 
 
 @router.post("/", response_model=EvaluationResponse)
 async def evaluate_single(
     evaluation_request: EvaluationRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    deepeval_service: DeepEvalService = Depends(get_deepeval_service)
 ):
     """Evaluate a single test case synchronously."""
     try:
@@ -33,8 +51,9 @@ async def evaluate_single(
             evaluation_request.test_case,
             evaluation_request.metrics
         )
-        
-        return EvaluationResponse(result=result)
+
+        # result is already a validated model, so skip re-validating the wrapper
+        return EvaluationResponse.model_construct(result=result)
     
     except Exception as e:
         raise HTTPException(
@@ -46,7 +65,8 @@ async def evaluate_single(
 @router.post("/bulk", response_model=BulkEvaluationResponse)
 async def evaluate_bulk(
     bulk_request: BulkEvaluationRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    deepeval_service: DeepEvalService = Depends(get_deepeval_service)
 ):
     """Evaluate multiple test cases synchronously."""
     try:
@@ -71,41 +91,43 @@ async def evaluate_bulk(
 @router.post("/async", response_model=AsyncEvaluationResponse)
 async def evaluate_async(
     evaluation_request: EvaluationRequest,
-    background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service),
+    task_queue: TaskQueue = Depends(get_task_queue)
 ):
     """Start an asynchronous evaluation job for a single test case."""
     # Create job
-    job_id = await job_service.create_job(
+    job_id, created_at = await job_service.create_job(
         job_name=evaluation_request.job_name,
         tags=evaluation_request.tags,
         metadata={"user": current_user.username, "type": "single"}
     )
     
-    # Start background task
-    background_tasks.add_task(
-        _run_async_single_evaluation,
-        job_id,
-        evaluation_request
-    )
+    # Hand the job to the bounded worker pool
+    if not task_queue.enqueue(_run_async_single_evaluation, job_id, evaluation_request):
+        await job_service.fail_job(job_id, "Task queue full")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Evaluation queue is full. Please retry later."
+        )
     
-    job = await job_service.get_job(job_id)
     return AsyncEvaluationResponse(
         job_id=job_id,
         status="pending",
-        created_at=job.created_at if job else datetime.now()
+        created_at=created_at
     )
 
 
 @router.post("/async/bulk", response_model=AsyncEvaluationResponse)
 async def evaluate_bulk_async(
     bulk_request: BulkEvaluationRequest,
-    background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service),
+    task_queue: TaskQueue = Depends(get_task_queue)
 ):
     """Start an asynchronous evaluation job for multiple test cases."""
     # Create job
-    job_id = await job_service.create_job(
+    job_id, created_at = await job_service.create_job(
         job_name=bulk_request.job_name,
         tags=bulk_request.tags,
         metadata={
@@ -115,38 +137,68 @@ async def evaluate_bulk_async(
         }
     )
     
-    # Start background task
-    background_tasks.add_task(
-        _run_async_bulk_evaluation,
-        job_id,
-        bulk_request
-    )
+    # Hand the job to the bounded worker pool
+    if not task_queue.enqueue(_run_async_bulk_evaluation, job_id, bulk_request):
+        await job_service.fail_job(job_id, "Task queue full")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Evaluation queue is full. Please retry later."
+        )
     
-    job = await job_service.get_job(job_id)
     return AsyncEvaluationResponse(
         job_id=job_id,
         status="pending",
-        created_at=job.created_at if job else datetime.now()
+        created_at=created_at
     )
 
 
 @router.post("/dataset", response_model=AsyncEvaluationResponse)
 async def evaluate_dataset(
+    request: Request,
     dataset_request: DatasetEvaluationRequest,
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service),
+    task_queue: TaskQueue = Depends(get_task_queue)
 ):
     """Evaluate a dataset from uploaded file."""
-    # Validate file size
-    if file.size > settings.max_file_size:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Maximum size: {settings.max_file_size / 1024 / 1024}MB"
-        )
-    
+    size_error = HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size: {settings.max_file_size / 1024 / 1024}MB"
+    )
+
+    # Reject oversized uploads before buffering anything: Content-Length
+    # bounds the whole body, so exceeding the limit there is a sure reject
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.max_file_size:
+        raise size_error
+
+    # file.size can be None for chunked uploads, so the streaming loop
+    # below remains the authoritative check
+    if file.size and file.size > settings.max_file_size:
+        raise size_error
+
+    # Stream the upload to a temp file in chunks so memory stays flat
+    # regardless of file size, aborting as soon as the limit is crossed.
+    # The file operations block, so they go through to_thread like the
+    # parse does - a slow disk must not stall the event loop.
+    tmp = await asyncio.to_thread(tempfile.NamedTemporaryFile, delete=False)
+    total_bytes = 0
+    try:
+        while chunk := await file.read(1 << 20):
+            total_bytes += len(chunk)
+            if total_bytes > settings.max_file_size:
+                raise size_error
+            await asyncio.to_thread(tmp.write, chunk)
+    except Exception:
+        await asyncio.to_thread(tmp.close)
+        await asyncio.to_thread(os.unlink, tmp.name)
+        raise
+    finally:
+        await asyncio.to_thread(tmp.close)
+
     # Create job
-    job_id = await job_service.create_job(
+    job_id, created_at = await job_service.create_job(
         job_name=dataset_request.job_name or f"Dataset: {dataset_request.dataset_name}",
         tags=dataset_request.tags,
         metadata={
@@ -157,24 +209,26 @@ async def evaluate_dataset(
         }
     )
     
-    # Start background task
-    background_tasks.add_task(
-        _run_async_dataset_evaluation,
-        job_id,
-        dataset_request,
-        file
-    )
+    # Hand the job to the bounded worker pool
+    if not task_queue.enqueue(_run_async_dataset_evaluation, job_id, dataset_request, tmp.name, file.filename):
+        await job_service.fail_job(job_id, "Task queue full")
+        await asyncio.to_thread(os.unlink, tmp.name)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Evaluation queue is full. Please retry later."
+        )
     
-    job = await job_service.get_job(job_id)
     return AsyncEvaluationResponse(
         job_id=job_id,
         status="pending",
-        created_at=job.created_at if job else datetime.now()
+        created_at=created_at
     )
 
 
 async def _run_async_single_evaluation(job_id: str, request: EvaluationRequest):
     """Background task for single evaluation."""
+    deepeval_service = get_deepeval_service()
+    job_service = get_job_service()
     try:
         await job_service.update_job_status(job_id, "running")
         await job_service.update_job_progress(job_id, 0, 1, "Starting evaluation...")
@@ -185,17 +239,10 @@ async def _run_async_single_evaluation(job_id: str, request: EvaluationRequest):
         )
         
         await job_service.update_job_progress(job_id, 1, 1, "Evaluation completed")
-        
-        # Create summary for single result
-        from ..models.evaluation import EvaluationSummary
-        summary = EvaluationSummary(
-            total_test_cases=1,
-            successful_test_cases=1 if result.overall_success else 0,
-            failed_test_cases=0 if result.overall_success else 1,
-            success_rate=1.0 if result.overall_success else 0.0,
-            total_execution_time=result.execution_time,
-        )
-        
+
+        # Summarize through the same path the bulk jobs use
+        summary = deepeval_service._calculate_summary([result], result.execution_time or 0.0)
+
         await job_service.complete_job(job_id, [result], summary)
     
     except Exception as e:
@@ -204,34 +251,66 @@ async def _run_async_single_evaluation(job_id: str, request: EvaluationRequest):
 
 async def _run_async_bulk_evaluation(job_id: str, request: BulkEvaluationRequest):
     """Background task for bulk evaluation."""
+    deepeval_service = get_deepeval_service()
+    job_service = get_job_service()
     try:
         await job_service.update_job_status(job_id, "running")
         total_tests = len(request.test_cases)
         await job_service.update_job_progress(job_id, 0, total_tests, "Starting bulk evaluation...")
-        
-        # Process in batches to provide progress updates
-        batch_size = min(request.max_concurrent or 10, 10)
-        results = []
-        
-        for i in range(0, total_tests, batch_size):
-            batch = request.test_cases[i:i + batch_size]
-            
-            # Evaluate batch
-            batch_data = await deepeval_service.evaluate_bulk(
-                batch,
-                request.metrics,
-                max_concurrent=batch_size
-            )
-            
-            results.extend(batch_data["results"])
-            
-            # Update progress
-            completed = min(i + batch_size, total_tests)
-            await job_service.update_job_progress(
-                job_id, completed, total_tests, 
-                f"Processed {completed}/{total_tests} test cases"
-            )
-        
+
+        # Keep max_concurrent evaluations in flight at all times instead of
+        # processing in stop-and-wait batches
+        max_concurrent = request.max_concurrent or settings.default_max_concurrent
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def evaluate_one(index: int, test_case):
+            """Evaluate one test case without letting an exception escape."""
+            async with semaphore:
+                try:
+                    result = await deepeval_service.evaluate_single(test_case, request.metrics)
+                except Exception as e:
+                    result = TestCaseResult(
+                        test_case=test_case,
+                        metrics=[MetricResult(
+                            metric_type="error",
+                            score=0.0,
+                            threshold=0.0,
+                            success=False,
+                            error=str(e)
+                        )],
+                        overall_success=False,
+                    )
+                return index, result
+
+        tasks = [
+            asyncio.create_task(evaluate_one(i, tc))
+            for i, tc in enumerate(request.test_cases)
+        ]
+
+        results = [None] * total_tests
+        completed = 0
+
+        # Coalesce progress writes so the job store sees at most ~100 updates
+        # per job (plus at most one per second), however large the dataset
+        progress_step = max(1, total_tests // 100)
+        last_reported = 0
+        last_report_ts = time.monotonic()
+
+        for future in asyncio.as_completed(tasks):
+            index, result = await future
+            results[index] = result
+            completed += 1
+
+            # Update progress, coalesced; the final completion always reports
+            now = time.monotonic()
+            if (completed - last_reported) >= progress_step or (now - last_report_ts) > 1.0 or completed == total_tests:
+                await job_service.update_job_progress(
+                    job_id, completed, total_tests,
+                    f"Processed {completed}/{total_tests} test cases"
+                )
+                last_reported = completed
+                last_report_ts = now
+
         # Calculate final summary
         final_summary = deepeval_service._calculate_summary(results, 0)
         
@@ -242,18 +321,20 @@ async def _run_async_bulk_evaluation(job_id: str, request: BulkEvaluationRequest
 
 
 async def _run_async_dataset_evaluation(
-    job_id: str, 
-    request: DatasetEvaluationRequest, 
-    file: UploadFile
+    job_id: str,
+    request: DatasetEvaluationRequest,
+    file_path: str,
+    filename: str
 ):
     """Background task for dataset evaluation."""
+    deepeval_service = get_deepeval_service()
+    job_service = get_job_service()
     try:
         await job_service.update_job_status(job_id, "running")
         await job_service.update_job_progress(job_id, 0, 100, "Processing dataset file...")
-        
-        # Read and parse file
-        content = await file.read()
-        test_cases = await _parse_dataset_file(content, file.filename, request)
+
+        # Parse file from the spooled temp copy
+        test_cases = await _parse_dataset_file(file_path, filename, request)
         
         total_tests = len(test_cases)
         await job_service.update_job_progress(
@@ -277,66 +358,87 @@ async def _run_async_dataset_evaluation(
     
     except Exception as e:
         await job_service.fail_job(job_id, str(e))
+    finally:
+        # Always remove the spooled upload once the job is done with it
+        try:
+            os.unlink(file_path)
+        except OSError:
+            pass
+
 
+async def _parse_dataset_file(file_path: str, filename: str, request: DatasetEvaluationRequest) -> List:
+    """Parse dataset file into test cases without blocking the event loop."""
+    return await asyncio.to_thread(_parse_dataset_file_sync, file_path, filename, request)
 
-async def _parse_dataset_file(content: bytes, filename: str, request: DatasetEvaluationRequest) -> List:
-    """Parse dataset file into test cases."""
+
+def _parse_dataset_file_sync(file_path: str, filename: str, request: DatasetEvaluationRequest) -> List:
+    """Parse dataset file into test cases (runs in a worker thread)."""
     import pandas as pd
-    import json
-    from io import StringIO, BytesIO
-    
+    import orjson
+
     # Determine file format
+    suffix = os.path.splitext(filename)[1].lower()
     file_format = request.file_format
     if file_format == "auto":
-        if filename.endswith('.csv'):
+        if suffix in _CSV_SUFFIXES:
             file_format = "csv"
-        elif filename.endswith(('.json', '.jsonl')):
+        elif suffix in _JSON_SUFFIXES:
             file_format = "json"
         else:
             raise ValueError("Could not determine file format. Please specify file_format.")
-    
-    # Parse file
+
+    column_mapping = request.column_mapping or {}
+
+    # Parse file straight from disk (orjson and pandas both accept raw bytes)
     if file_format == "csv":
-        df = pd.read_csv(StringIO(content.decode('utf-8')))
-        data = df.to_dict('records')
+        # dtype=str keeps every cell a string (model_construct below skips
+        # validation, so numeric columns must not leak int64/float64 into
+        # str-typed model fields); NaN still marks missing values for the
+        # where() conversion to None
+        df = pd.read_csv(file_path, dtype=str)
+        if column_mapping:
+            # Remap columns to test case fields in one pandas pass instead
+            # of a per-row Python loop
+            present = [c for c in column_mapping.values() if c in df.columns]
+            df = df[present].rename(columns={v: k for k, v in column_mapping.items()})
+        # Normalize to the known field set; absent columns fill with NaN,
+        # which where() below converts to None in C
+        df = df.reindex(columns=_TEST_CASE_FIELDS)
+        data = df.where(df.notna(), None).to_dict(orient='records')
     elif file_format == "json":
-        content_str = content.decode('utf-8')
-        if filename.endswith('.jsonl'):
-            # JSON Lines format
-            data = [json.loads(line) for line in content_str.strip().split('\n')]
+        if suffix == '.jsonl':
+            # JSON Lines format - stream line by line, never one big string
+            with open(file_path, 'rb') as f:
+                data = [orjson.loads(line) for line in f if line.strip()]
         else:
             # Regular JSON
-            data = json.loads(content_str)
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
             if not isinstance(data, list):
                 data = [data]
     else:
         raise ValueError(f"Unsupported file format: {file_format}")
-    
-    # Convert to test cases
+
+    if file_format == "json" and column_mapping:
+        # JSON records still need the field remap applied per row
+        data = [
+            {field: row[column] for field, column in column_mapping.items() if column in row}
+            for row in data
+        ]
+
+    # Convert to test cases - rows come from a trusted parse, so use
+    # model_construct to skip per-field validation on large datasets
     from ..models.test_cases import LLMTestCaseRequest
     test_cases = []
-    
-    column_mapping = request.column_mapping or {}
-    
+
     for row in data:
-        # Map columns to test case fields
-        mapped_row = {}
-        for field, column in column_mapping.items():
-            if column in row:
-                mapped_row[field] = row[column]
-        
-        # Use direct field names if no mapping provided
-        if not column_mapping:
-            mapped_row = row
-        
-        # Create test case
-        test_case = LLMTestCaseRequest(
-            input=mapped_row.get('input', ''),
-            actual_output=mapped_row.get('actual_output', ''),
-            expected_output=mapped_row.get('expected_output'),
-            retrieval_context=mapped_row.get('retrieval_context'),
-            context=mapped_row.get('context'),
+        test_case = LLMTestCaseRequest.model_construct(
+            input=row.get('input') or '',
+            actual_output=row.get('actual_output') or '',
+            expected_output=row.get('expected_output'),
+            retrieval_context=row.get('retrieval_context'),
+            context=row.get('context'),
         )
         test_cases.append(test_case)
-    
+
     return test_cases
@@ -1,13 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
 from ..models.auth import User
 from ..models.evaluation import JobStatus, AsyncEvaluationResponse, JobListResponse
-from ..services.job_service import JobService
+from ..services import JobService, get_job_service
 from ..auth import get_current_user, get_current_admin_user
 
-router = APIRouter(prefix="/jobs", tags=["Jobs"])
-job_service = JobService()
+# Job listings and completed-job payloads can be large - use orjson
+router = APIRouter(prefix="/jobs", tags=["Jobs"], default_response_class=ORJSONResponse)
 
 
 @router.get("/", response_model=JobListResponse)
@@ -16,7 +17,8 @@ async def list_jobs(
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     status: Optional[JobStatus] = Query(None, description="Filter by job status"),
     tag: Optional[str] = Query(None, description="Filter by tag"),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
 ):
     """List evaluation jobs with pagination and filtering."""
     return await job_service.list_jobs(
@@ -30,7 +32,8 @@ async def list_jobs(
 @router.get("/{job_id}", response_model=AsyncEvaluationResponse)
 async def get_job(
     job_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
 ):
     """Get evaluation job by ID."""
     job = await job_service.get_job(job_id)
@@ -43,7 +46,8 @@ async def get_job(
 @router.post("/{job_id}/cancel")
 async def cancel_job(
     job_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
 ):
     """Cancel a running evaluation job."""
     success = await job_service.cancel_job(job_id)
@@ -59,7 +63,8 @@ async def cancel_job(
 @router.delete("/{job_id}")
 async def delete_job(
     job_id: str,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
 ):
     """Delete an evaluation job."""
     success = await job_service.delete_job(job_id)
@@ -71,7 +76,8 @@ async def delete_job(
 
 @router.get("/stats/summary")
 async def get_job_stats(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    job_service: JobService = Depends(get_job_service)
 ):
     """Get job statistics summary."""
     return job_service.get_job_stats()
@@ -80,7 +86,8 @@ async def get_job_stats(
 @router.post("/cleanup")
 async def cleanup_old_jobs(
     max_age_days: int = Query(7, ge=1, le=365, description="Maximum age in days"),
-    current_user: User = Depends(get_current_admin_user)  # Admin only
+    current_user: User = Depends(get_current_admin_user),  # Admin only
+    job_service: JobService = Depends(get_job_service)
 ):
     """Clean up old completed jobs."""
     deleted_count = await job_service.cleanup_old_jobs(max_age_days)
@@ -3,15 +3,17 @@ from typing import List, Dict, Any
 
 from ..models.auth import User
 from ..models.metrics import MetricType, MetricInfo
-from ..services.deepeval_service import DeepEvalService
+from ..services import DeepEvalService, get_deepeval_service
 from ..auth import get_current_user
 
 router = APIRouter(prefix="/metrics", tags=["Metrics"])
-deepeval_service = DeepEvalService()
 
 
 @router.get("/", response_model=List[Dict[str, Any]])
-async def list_available_metrics(current_user: User = Depends(get_current_user)):
+async def list_available_metrics(
+    current_user: User = Depends(get_current_user),
+    deepeval_service: DeepEvalService = Depends(get_deepeval_service)
+):
     """List all available metrics."""
     metrics = deepeval_service.list_available_metrics()
     
@@ -25,7 +27,10 @@ async def list_available_metrics(current_user: User = Depends(get_current_user))
 
 
 @router.get("/categories")
-async def list_metric_categories(current_user: User = Depends(get_current_user)):
+async def list_metric_categories(
+    current_user: User = Depends(get_current_user),
+    deepeval_service: DeepEvalService = Depends(get_deepeval_service)
+):
     """List metric categories."""
     metrics = deepeval_service.list_available_metrics()
     categories = {}
@@ -49,7 +54,11 @@ async def list_metric_categories(current_user: User = Depends(get_current_user))
 
 
 @router.get("/{metric_type}")
-async def get_metric_info(metric_type: MetricType, current_user: User = Depends(get_current_user)):
+async def get_metric_info(
+    metric_type: MetricType,
+    current_user: User = Depends(get_current_user),
+    deepeval_service: DeepEvalService = Depends(get_deepeval_service)
+):
     """Get detailed information about a specific metric."""
     try:
         info = deepeval_service.get_metric_info(metric_type)
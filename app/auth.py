@@ -1,68 +1,153 @@
+import time
+import hashlib
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from cachetools import TTLCache
 
 from .models.auth import User
-from .services.auth_service import AuthService
+from .services import get_auth_service
+from .config import settings
 
-# Initialize services
-auth_service = AuthService()
 security = HTTPBearer(auto_error=False)
 
+# Cache of recently verified tokens so the JWT signature check isn't repeated
+# on every request. Keyed by a token digest (raw tokens are never stored) and
+# each entry carries the token's own expiry so an expired token is never served.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+
+# Configured API keys, frozen at import time for O(1) membership checks, plus
+# a cache mapping key digests to resolved users so the User allocation is
+# skipped for keys seen recently.
+_API_KEY_SET = frozenset(settings.api_keys_list)
+_api_key_cache: TTLCache = TTLCache(maxsize=2048, ttl=300)
+
+
+def _token_cache_key(token: str) -> str:
+    """Hash a token for use as a cache key (avoids storing raw tokens)."""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
 
 async def get_current_user_from_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Optional[User]:
     """Get current user from JWT token."""
     if not credentials:
         return None
-    
+
+    token = credentials.credentials
+    cache_key = _token_cache_key(token)
+
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at is None or time.time() < expires_at:
+            return user
+        _token_cache.pop(cache_key, None)
+
+    auth_service = get_auth_service()
     try:
-        token_data = auth_service.verify_token(credentials.credentials)
+        token_data = auth_service.verify_token(token)
         user = auth_service.get_user_by_token(token_data)
-        return user
     except HTTPException:
         return None
 
+    _token_cache[cache_key] = (user, token_data.exp)
+    return user
+
 
-async def get_current_user_from_api_key(request: Request) -> Optional[User]:
-    """Get current user from API key."""
-    # Try to get API key from header (case-insensitive)
-    api_key = None
-    for header_name, header_value in request.headers.items():
-        if header_name.lower() == "x-api-key":
-            api_key = header_value
-            break
-    
+def get_current_user_from_api_key(request: Request) -> Optional[User]:
+    """Get current user from API key (pure CPU work, so no coroutine needed)."""
+    # Starlette headers are case-insensitive, so a direct lookup suffices
+    api_key = request.headers.get("x-api-key")
     if not api_key:
         return None
-    
-    if auth_service.validate_api_key(api_key):
-        return auth_service.get_api_user()
-    
+    return _resolve_api_key(api_key)
+
+
+def _resolve_api_key(api_key: str) -> Optional[User]:
+    """Resolve an API key string to a user via the digest cache."""
+    cache_key = _token_cache_key(api_key)
+    user = _api_key_cache.get(cache_key)
+    if user is not None:
+        return user
+
+    if api_key in _API_KEY_SET:
+        user = get_auth_service().get_api_user()
+        _api_key_cache[cache_key] = user
+        return user
+
     return None
 
 
-async def get_current_user(
-    request: Request,
-    user_from_token: Optional[User] = Depends(get_current_user_from_token),
-) -> User:
+# Sentinel distinguishing "middleware never ran" from "ran, no credentials"
+_UNRESOLVED = object()
+
+
+class AuthResolverMiddleware:
+    """Pure ASGI middleware that resolves the caller once per request.
+
+    Scans the raw header list a single time for credentials, resolves them
+    through the same caches the dependencies use, and stashes the result in
+    scope state. The auth dependencies then just read the slot instead of
+    re-parsing headers and re-verifying the JWT per dependency tree.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        authorization = api_key = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+            elif name == b"x-api-key":
+                api_key = value
+
+        user = None
+        if authorization is not None and authorization[:7].lower() == b"bearer ":
+            credentials = HTTPAuthorizationCredentials(
+                scheme="Bearer", credentials=authorization[7:].decode("latin-1")
+            )
+            user = await get_current_user_from_token(credentials)
+        if user is None and api_key is not None:
+            user = _resolve_api_key(api_key.decode("latin-1"))
+
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
+
+
+def _user_from_scope(request: Request):
+    """Read the user the middleware resolved, or _UNRESOLVED if it didn't run."""
+    return request.scope.get("state", {}).get("user", _UNRESOLVED)
+
+
+async def get_current_user(request: Request) -> User:
     """Get current user from either JWT token or API key."""
-    # Try API key authentication
-    user_from_api_key = await get_current_user_from_api_key(request)
-    
-    # Use token user or API key user
-    user = user_from_token or user_from_api_key
-    
+    user = _user_from_scope(request)
+    if user is _UNRESOLVED:
+        # Middleware not installed (e.g. app constructed without it) -
+        # fall back to resolving straight from the headers
+        user = await resolve_optional_user(request)
+
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required. Provide either Bearer token or X-API-Key header.",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
+
+    # Stash for downstream dependencies/handlers so they can reuse the
+    # resolved user without re-running auth
+    request.state.user = user
     return user
 
 
-async def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_admin_user(
+    current_user: User = Depends(get_current_user),
+) -> User:
     """Get current user with admin privileges."""
     if "admin" not in current_user.scopes:
         raise HTTPException(
@@ -72,11 +157,27 @@ async def get_current_admin_user(current_user: User = Depends(get_current_user))
     return current_user
 
 
+async def resolve_optional_user(request: Request) -> Optional[User]:
+    """Resolve the caller straight from headers, outside dependency wiring.
+
+    For handlers where auth is optional and which check the raw headers
+    themselves, so the Bearer parsing only runs when a credential is present.
+    """
+    user = None
+    authorization = request.headers.get("authorization")
+    if authorization and authorization[:7].lower() == "bearer ":
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=authorization[7:])
+        user = await get_current_user_from_token(credentials)
+    if user is None:
+        user = get_current_user_from_api_key(request)
+    request.state.user = user
+    return user
+
+
 # Optional authentication (doesn't raise error if not authenticated)
-async def get_optional_user(
-    request: Request,
-    user_from_token: Optional[User] = Depends(get_current_user_from_token),
-) -> Optional[User]:
+async def get_optional_user(request: Request) -> Optional[User]:
     """Get current user if authenticated, otherwise None."""
-    user_from_api_key = await get_current_user_from_api_key(request)
-    return user_from_token or user_from_api_key
+    user = _user_from_scope(request)
+    if user is _UNRESOLVED:
+        user = await resolve_optional_user(request)
+    return user
@@ -51,12 +51,26 @@ class Settings(BaseSettings):
     default_max_concurrent: int = 10
     default_timeout: int = 300  # 5 minutes
     max_file_size: int = 10 * 1024 * 1024  # 10MB
+
+    # Production worker count. Defaults to 1 because JobService keeps jobs
+    # in a per-process dict: with multiple workers, a job created on one
+    # worker 404s on the others. Raise this only once the job store is
+    # shared (e.g. the Redis path stubbed above).
+    web_concurrency: int = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    # Background task queue
+    task_queue_workers: int = int(os.getenv("TASK_QUEUE_WORKERS", "4"))
+    task_queue_size: int = int(os.getenv("TASK_QUEUE_SIZE", "1024"))
     
     # Logging
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
-    # CORS
+    # Response timing header (disable to shave the per-request timing work)
+    emit_timing_header: bool = os.getenv("EMIT_TIMING_HEADER", "true").lower() == "true"
+
+    # CORS (disable entirely when a gateway in front already handles it)
+    cors_enabled: bool = os.getenv("CORS_ENABLED", "true").lower() == "true"
     cors_origins: List[str] = ["*"]  # Configure for production
     cors_allow_credentials: bool = True
     cors_allow_methods: List[str] = ["*"]
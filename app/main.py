@@ -1,14 +1,17 @@
+import asyncio
+import gzip
+import queue
 import time
 from contextlib import asynccontextmanager
-from typing import Optional
-from fastapi import FastAPI, Request, Depends
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 import logging
 
 from .config import settings
-from .models.auth import User
-from .auth import get_optional_user
+from .auth import AuthResolverMiddleware, get_optional_user
 from .api import (
     evaluation_router,
     auth_router,
@@ -17,30 +20,73 @@ from .api import (
     health_router,
 )
 
-# Configure logging
+# Configure logging. Records are funneled through an in-process queue and a
+# listener thread does the actual handler I/O, so a burst of log writes
+# (e.g. an error storm hitting the exception handler) never stalls the
+# event loop on stream flushes.
+_LOG_LEVEL = logging.getLevelName(settings.log_level.upper())
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
+    level=_LOG_LEVEL,
     format=settings.log_format
 )
+_log_queue: queue.Queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+# The listener thread is started in lifespan, not here: under gunicorn
+# --preload this module imports in the master, and a thread started
+# pre-fork would not survive into the workers - leaving every worker
+# enqueueing records that nothing drains. lifespan runs once per worker
+# process, so each worker gets its own live listener.
+
 logger = logging.getLogger(__name__)
 
+# Precomputed level flag for hot-path call sites: checking a module-level
+# bool is cheaper than isEnabledFor, and skips building the record when it
+# would be dropped anyway. The only per-request log call is the exception
+# handler's, so error is the only level that needs a flag.
+ERROR_ENABLED = _LOG_LEVEL <= logging.ERROR
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
-    logger.info(f"Starting {settings.app_name} v{settings.version}")
-    
-    # Initialize services
+    _log_listener.start()
+    logger.info("Starting %s v%s", settings.app_name, settings.version)
+
+    # Build the middleware stack up front rather than lazily on the first
+    # request, so the first caller doesn't pay the construction cost
+    if app.middleware_stack is None:
+        app.middleware_stack = app.build_middleware_stack()
+
+    # Start the bounded background-task worker pool
+    from .services import get_task_queue
+    task_queue = get_task_queue()
+    task_queue.start()
+
+    # Warm the shared services once and expose DeepEval on app.state; the
+    # routers resolve the same singletons through the get_* factories.
+    # Construction and the health probe do blocking imports/IO, so run them
+    # in threads - and run the independent warmups concurrently so cold
+    # start costs max-of-latencies instead of sum-of-latencies. The auth
+    # service in particular pays a deliberate bcrypt hash at construction.
+    async def _init_deepeval():
+        service = await asyncio.to_thread(get_deepeval_service)
+        return service, await asyncio.to_thread(service.health_check)
+
     try:
-        from .services.deepeval_service import DeepEvalService
-        deepeval_service = DeepEvalService()
-        health_data = deepeval_service.health_check()
+        from .services import get_auth_service, get_deepeval_service
+        (deepeval_service, health_data), _ = await asyncio.gather(
+            _init_deepeval(),
+            asyncio.to_thread(get_auth_service),
+        )
+        app.state.deepeval_service = deepeval_service
         
         if not health_data["deepeval_available"]:
             logger.warning("DeepEval library not available!")
         else:
-            logger.info(f"DeepEval available - {health_data['supported_metrics']} metrics supported")
+            logger.info("DeepEval available - %s metrics supported", health_data["supported_metrics"])
         
         if health_data["openai_configured"]:
             logger.info("OpenAI API key configured")
@@ -48,12 +94,47 @@ async def lifespan(app: FastAPI):
             logger.warning("OpenAI API key not configured")
             
     except Exception as e:
-        logger.error(f"Failed to initialize services: {e}")
+        logger.error("Failed to initialize services: %s", e)
     
     yield
-    
+
     # Shutdown
+    await task_queue.stop()
     logger.info("Shutting down application")
+    _log_listener.stop()
+
+
+# Bind once at module scope to skip the attribute lookup per request
+_perf_counter = time.perf_counter
+
+
+class TimingMiddleware:
+    """Pure ASGI middleware that adds an X-Process-Time response header.
+
+    Written as a raw ASGI callable rather than @app.middleware("http")
+    because BaseHTTPMiddleware spawns an extra task and stream pair per
+    request, which costs throughput on every endpoint in the app.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = _perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                process_time = _perf_counter() - start_time
+                # bytes %-formatting writes the header value directly, without
+                # the str() repr + encode() round-trip
+                message["headers"].append((b"x-process-time", b"%.6f" % process_time))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
 
 # Create FastAPI app
@@ -61,36 +142,53 @@ app = FastAPI(
     title=settings.app_name,
     description="REST API wrapper for DeepEval Python library",
     version=settings.version,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    # Interactive docs (and the OpenAPI schema build behind them) only in
+    # debug - production skips the schema generation pass and the extra routes
+    docs_url="/docs" if settings.debug else None,
+    redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=settings.cors_allow_credentials,
-    allow_methods=settings.cors_allow_methods,
-    allow_headers=settings.cors_allow_headers,
-)
+# Resolve credentials once per request; the auth dependencies read the
+# result off request.state instead of re-running header parsing and JWT
+# verification per dependency tree. Added first so it sits innermost and
+# never sees CORS preflights.
+app.add_middleware(AuthResolverMiddleware)
+
+# Add CORS middleware - skip the per-request middleware frame entirely for
+# same-origin/internal deployments where a gateway handles CORS
+if settings.cors_enabled:
+    # Normalize the configured origins once (lowercase, no trailing slash,
+    # deduplicated) so the middleware's per-request comparisons are against
+    # a clean list; a wildcard short-circuits to the fast allow-all path
+    if "*" in settings.cors_origins:
+        _cors_origins = ["*"]
+    else:
+        _cors_origins = sorted({origin.lower().rstrip("/") for origin in settings.cors_origins})
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=_cors_origins,
+        allow_credentials=settings.cors_allow_credentials,
+        allow_methods=settings.cors_allow_methods,
+        allow_headers=settings.cors_allow_headers,
+    )
 
 
-# Request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+# Request timing middleware - skipped entirely when the header is disabled,
+# so the send-wrapper closure isn't allocated per request
+if settings.emit_timing_header:
+    app.add_middleware(TimingMiddleware)
 
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    if ERROR_ENABLED:
+        logger.error("Unhandled exception: %s", exc, exc_info=exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -101,34 +199,85 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 # Include routers
-app.include_router(health_router)
-app.include_router(auth_router)
-app.include_router(evaluation_router)
-app.include_router(metrics_router)
-app.include_router(jobs_router)
+for router in (health_router, auth_router, evaluation_router, metrics_router, jobs_router):
+    app.include_router(router)
+
+
+# Static response payloads, built once at import time - these endpoints are
+# polled constantly by service discovery and would otherwise rebuild the same
+# nested dicts (and redo the size arithmetic) on every request
+_AUTH_REQUIRED_PAYLOAD = {
+    "message": "Authentication Required",
+    "detail": "You need to be authenticated to access this API. Please provide either a Bearer token or X-API-Key header.",
+    "version": settings.version,
+    "docs": "/docs",
+    "authentication": {
+        "methods": ["JWT Bearer Token", "API Key (X-API-Key header)"],
+        "endpoints": {
+            "login": "/auth/login",
+            "validate": "/auth/validate-token",
+            "user_info": "/auth/me"
+        }
+    }
+}
+
+_INFO_PAYLOAD = {
+    "name": settings.app_name,
+    "version": settings.version,
+    "description": "REST API wrapper for DeepEval Python library",
+    "supported_features": [
+        "30+ evaluation metrics",
+        "Single and batch evaluation",
+        "Asynchronous job processing",
+        "Multiple test case types (LLM, Conversational, Multimodal, Arena)",
+        "JWT and API key authentication",
+        "Dataset file upload and processing",
+        "Comprehensive error handling"
+    ],
+    "authentication": {
+        "methods": ["JWT Bearer Token", "API Key (X-API-Key header)"],
+        "endpoints": {
+            "login": "/auth/login",
+            "validate": "/auth/validate-token",
+            "user_info": "/auth/me"
+        }
+    },
+    "evaluation": {
+        "sync_endpoints": ["/evaluate", "/evaluate/bulk"],
+        "async_endpoints": ["/evaluate/async", "/evaluate/async/bulk", "/evaluate/dataset"],
+        "supported_formats": ["JSON", "CSV", "JSONL"]
+    },
+    "limits": {
+        "max_file_size_mb": settings.max_file_size // 1024 // 1024,
+        "default_max_concurrent": settings.default_max_concurrent,
+        "default_timeout_seconds": settings.default_timeout
+    }
+}
+
+
+# Pre-serialized (and pre-compressed) /info body - the payload never changes,
+# so neither serialization nor compression needs to happen per request
+_INFO_BYTES = orjson.dumps(_INFO_PAYLOAD)
+_INFO_GZIP = gzip.compress(_INFO_BYTES, compresslevel=6)
+
+
+# HEAD probe for load balancers - no auth, no body, no dict construction
+@app.head("/", include_in_schema=False)
+async def root_head():
+    return Response(status_code=204)
 
 
 # Root endpoint
 @app.get("/", tags=["Root"])
-async def root(request: Request, current_user: Optional[User] = Depends(get_optional_user)):
+async def root(request: Request):
     """Root endpoint with basic information."""
-    
+
+    # AuthResolverMiddleware already resolved any credentials - this is a
+    # plain state read, no header parsing or JWT work here
+    current_user = await get_optional_user(request)
     if current_user is None:
-        return {
-            "message": "Authentication Required",
-            "detail": "You need to be authenticated to access this API. Please provide either a Bearer token or X-API-Key header.",
-            "version": settings.version,
-            "docs": "/docs",
-            "authentication": {
-                "methods": ["JWT Bearer Token", "API Key (X-API-Key header)"],
-                "endpoints": {
-                    "login": "/auth/login",
-                    "validate": "/auth/validate-token",
-                    "user_info": "/auth/me"
-                }
-            }
-        }
-    
+        return _AUTH_REQUIRED_PAYLOAD
+
     return {
         "message": f"Welcome to {settings.app_name}",
         "version": settings.version,
@@ -148,48 +297,51 @@ async def root(request: Request, current_user: Optional[User] = Depends(get_opti
 
 # API Info endpoint
 @app.get("/info", tags=["Root"])
-async def api_info():
+async def api_info(request: Request):
     """Get API information."""
-    return {
-        "name": settings.app_name,
-        "version": settings.version,
-        "description": "REST API wrapper for DeepEval Python library",
-        "supported_features": [
-            "30+ evaluation metrics",
-            "Single and batch evaluation",
-            "Asynchronous job processing",
-            "Multiple test case types (LLM, Conversational, Multimodal, Arena)",
-            "JWT and API key authentication",
-            "Dataset file upload and processing",
-            "Comprehensive error handling"
-        ],
-        "authentication": {
-            "methods": ["JWT Bearer Token", "API Key (X-API-Key header)"],
-            "endpoints": {
-                "login": "/auth/login",
-                "validate": "/auth/validate-token",
-                "user_info": "/auth/me"
-            }
-        },
-        "evaluation": {
-            "sync_endpoints": ["/evaluate", "/evaluate/bulk"],
-            "async_endpoints": ["/evaluate/async", "/evaluate/async/bulk", "/evaluate/dataset"],
-            "supported_formats": ["JSON", "CSV", "JSONL"]
-        },
-        "limits": {
-            "max_file_size_mb": settings.max_file_size // 1024 // 1024,
-            "default_max_concurrent": settings.default_max_concurrent,
-            "default_timeout_seconds": settings.default_timeout
-        }
-    }
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_INFO_GZIP,
+            media_type="application/json",
+            headers={"content-encoding": "gzip", "vary": "Accept-Encoding"}
+        )
+    # Vary on both branches so shared caches keep the representations apart
+    return Response(
+        content=_INFO_BYTES,
+        media_type="application/json",
+        headers={"vary": "Accept-Encoding"}
+    )
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(
-        "app.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.debug,
-        log_level=settings.log_level.lower()
-    )
+    if settings.debug:
+        import uvicorn
+        uvicorn.run(
+            "app.main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=settings.debug,
+            log_level=settings.log_level.lower(),
+            # uvicorn[standard] ships uvloop and httptools - request them
+            # explicitly for the libuv event loop and C HTTP parser
+            loop="uvloop",
+            http="httptools"
+        )
+    else:
+        # Production: uvicorn workers under gunicorn, with --preload so the
+        # app module is imported once and the workers share copy-on-write
+        # pages. Worker count comes from WEB_CONCURRENCY and defaults to 1:
+        # the in-memory JobService is per-process, so async jobs are only
+        # visible to the worker that created them - don't scale out until
+        # the job store is shared.
+        import os
+        workers = settings.web_concurrency
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "app.main:app",
+            "-k", "uvicorn.workers.UvicornWorker",
+            "-w", str(workers),
+            "--preload",
+            "--bind", f"{settings.host}:{settings.port}",
+            "--log-level", settings.log_level.lower(),
+        ])
@@ -13,6 +13,7 @@ class TokenData(BaseModel):
     """Token payload data."""
     username: Optional[str] = None
     scopes: Optional[list] = []
+    exp: Optional[int] = None  # Token expiry (unix timestamp)
 
 
 class User(BaseModel):
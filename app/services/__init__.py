@@ -1,5 +1,42 @@
+import functools
+
 from .deepeval_service import DeepEvalService
 from .job_service import JobService
 from .auth_service import AuthService
+from .task_queue import TaskQueue
+
+
+@functools.lru_cache(maxsize=1)
+def get_deepeval_service() -> DeepEvalService:
+    """Shared DeepEvalService instance, created lazily on first use."""
+    return DeepEvalService()
+
+
+@functools.lru_cache(maxsize=1)
+def get_job_service() -> JobService:
+    """Shared JobService instance, created lazily on first use."""
+    return JobService()
+
+
+@functools.lru_cache(maxsize=1)
+def get_auth_service() -> AuthService:
+    """Shared AuthService instance, created lazily on first use."""
+    return AuthService()
+
+
+@functools.lru_cache(maxsize=1)
+def get_task_queue() -> TaskQueue:
+    """Shared TaskQueue instance; started/stopped by the app lifespan."""
+    return TaskQueue()
+
 
-__all__ = ["DeepEvalService", "JobService", "AuthService"]
+__all__ = [
+    "DeepEvalService",
+    "JobService",
+    "AuthService",
+    "TaskQueue",
+    "get_deepeval_service",
+    "get_job_service",
+    "get_auth_service",
+    "get_task_queue",
+]
@@ -68,7 +68,7 @@ class AuthService:
                     detail="Could not validate credentials",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
-            token_data = TokenData(username=username)
+            token_data = TokenData(username=username, exp=payload.get("exp"))
             return token_data
         except JWTError:
             raise HTTPException(
@@ -89,17 +89,19 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
             )
-        return User(
+        # Fields come straight off an already-validated UserInDB record, so
+        # model_construct skips a redundant validation pass on every auth
+        return User.model_construct(
             username=user.username,
             email=user.email,
             full_name=user.full_name,
             disabled=user.disabled,
             scopes=user.scopes
         )
-    
+
     def get_api_user(self) -> User:
         """Get user object for API key authentication."""
-        return User(
+        return User.model_construct(
             username="api_user",
             full_name="API User",
             scopes=["user"]
@@ -1,6 +1,6 @@
 import uuid
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import json
 
@@ -27,15 +27,20 @@ class JobService:
         job_name: Optional[str] = None,
         tags: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """Create a new evaluation job."""
+    ) -> Tuple[str, datetime]:
+        """Create a new evaluation job.
+
+        Returns the job ID together with its creation time so callers don't
+        need a follow-up get_job round-trip.
+        """
         job_id = str(uuid.uuid4())
-        
+        created_at = datetime.now()
+
         async with self._job_lock:
             self._jobs[job_id] = {
                 "job_id": job_id,
                 "status": JobStatus.PENDING,
-                "created_at": datetime.now(),
+                "created_at": created_at,
                 "started_at": None,
                 "completed_at": None,
                 "job_name": job_name,
@@ -46,8 +51,8 @@ class JobService:
                 "error": None,
                 "progress": {"current": 0, "total": 0, "percentage": 0.0},
             }
-        
-        return job_id
+
+        return job_id, created_at
     
     async def update_job_status(
         self,
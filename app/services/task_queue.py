@@ -0,0 +1,61 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TaskQueue:
+    """Bounded queue of background evaluation jobs drained by a worker pool.
+
+    FastAPI's BackgroundTasks schedules an unbounded number of coroutines on
+    the event loop, so a burst of async evaluation submissions piles up
+    concurrent LLM calls without limit. Jobs enqueued here wait for one of a
+    fixed number of workers instead, bounding both memory and in-flight work.
+    """
+
+    def __init__(self, worker_count: Optional[int] = None, max_size: Optional[int] = None):
+        self._worker_count = worker_count or settings.task_queue_workers
+        self._max_size = max_size or settings.task_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Spawn the worker tasks (called from app startup)."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_size)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self._worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel workers and wait for them to exit (called from app shutdown)."""
+        for worker in self._workers:
+            worker.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def enqueue(self, task_fn, *args) -> bool:
+        """Queue a job coroutine function; returns False if the queue is full."""
+        if self._queue is None:
+            raise RuntimeError("TaskQueue has not been started")
+        try:
+            self._queue.put_nowait((task_fn, args))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _worker(self) -> None:
+        """Drain the queue, running one job at a time."""
+        while True:
+            task_fn, args = await self._queue.get()
+            try:
+                await task_fn(*args)
+            except Exception:
+                logger.exception("Background task %s failed", getattr(task_fn, "__name__", task_fn))
+            finally:
+                self._queue.task_done()